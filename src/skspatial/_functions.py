@@ -43,9 +43,9 @@ def _contains_point(obj: Any, point: array_like, **kwargs: float) -> bool:
 
 def _sum_squares(obj: Any, points: array_like) -> np.float64:
     """Return the sum of squared distances from points to a spatial object."""
-    distances_squared = np.apply_along_axis(obj.distance_point, 1, points) ** 2
+    distances = obj.distance_points(points)
 
-    return distances_squared.sum()
+    return np.dot(distances, distances)
 
 
 def _mesh_to_points(X: array_like, Y: array_like, Z: array_like) -> np.ndarray:
@@ -53,6 +53,37 @@ def _mesh_to_points(X: array_like, Y: array_like, Z: array_like) -> np.ndarray:
     return np.vstack([*map(np.ravel, [X, Y, Z])]).T
 
 
+def _cross_3d(array_a: np.ndarray, array_b: np.ndarray) -> np.ndarray:
+    """
+    Return the cross product of two 3D arrays.
+
+    This avoids the overhead of :func:`numpy.cross`, which handles arrays of any shape.
+    The components are multiplied as Python scalars, which is much faster than
+    indexing into the arrays, and the result has the same dtype as :func:`numpy.cross`.
+
+    Examples
+    --------
+    >>> from skspatial._functions import _cross_3d
+
+    >>> _cross_3d([1, 0, 0], [0, 1, 0])
+    array([0, 0, 1])
+
+    >>> _cross_3d([1, 1, 1], [0, 1, 0])
+    array([-1,  0,  1])
+
+    """
+    array_a = np.asarray(array_a)
+    array_b = np.asarray(array_b)
+
+    a_0, a_1, a_2 = array_a.tolist()
+    b_0, b_1, b_2 = array_b.tolist()
+
+    return np.array(
+        [a_1 * b_2 - a_2 * b_1, a_2 * b_0 - a_0 * b_2, a_0 * b_1 - a_1 * b_0],
+        dtype=np.result_type(array_a, array_b),
+    )
+
+
 def np_float(func: Callable) -> Callable[..., np.float64]:
     """
     Cast the output type as np.float64.
@@ -134,4 +165,43 @@ def _solve_quadratic(a: float, b: float, c: float, n_digits: Optional[int] = Non
     return X
 
 
-_allclose = np.vectorize(math.isclose)
+def _allclose(array_a: array_like, array_b: array_like, *, rel_tol: float = 1e-09, abs_tol: float = 0.0) -> np.ndarray:
+    """
+    Apply :func:`math.isclose` element-wise to two arrays.
+
+    The comparison is the same as in :func:`math.isclose`, but it is computed with whole-array operations
+    instead of calling the function for each pair of elements.
+
+    Examples
+    --------
+    >>> from skspatial._functions import _allclose
+
+    >>> _allclose([1, 2, 3], [1, 2 + 1e-12, 3.1])
+    array([ True,  True, False])
+
+    >>> _allclose([0, 1], [1e-12, 1], abs_tol=1e-9)
+    array([ True,  True])
+
+    >>> _allclose([1, 2], [1, 2], rel_tol=-1)
+    Traceback (most recent call last):
+    ...
+    ValueError: tolerances must be non-negative
+
+    """
+    if rel_tol < 0 or abs_tol < 0:
+        raise ValueError("tolerances must be non-negative")
+
+    # math.isclose converts its inputs to Python floats.
+    array_a = np.asarray(array_a, dtype=np.float64)
+    array_b = np.asarray(array_b, dtype=np.float64)
+
+    with np.errstate(invalid='ignore', over='ignore'):
+        diff = np.abs(array_b - array_a)
+
+        is_close = (diff <= np.abs(rel_tol * array_b)) | (diff <= np.abs(rel_tol * array_a)) | (diff <= abs_tol)
+
+    # Equal values are close, including equal infinities,
+    # but an infinity is never close to a different value.
+    is_infinite = np.isinf(array_a) | np.isinf(array_b)
+
+    return (array_a == array_b) | (is_close & ~is_infinite)
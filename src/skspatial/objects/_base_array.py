@@ -129,12 +129,13 @@ class _BaseArray1D(_BaseArray):
     """Private base class for spatial objects based on a single 1D NumPy array."""
 
     def __new__(cls, array_like):
-        array = np.array(array_like)
+        # The input is converted only once, and an input ndarray is viewed rather than copied.
+        array = np.asarray(array_like)
 
         if array.ndim != 1:
             raise ValueError("The array must be 1D.")
 
-        return super().__new__(cls, array_like)
+        return super().__new__(cls, array)
 
     def __array_finalize__(self, _):
         self.dimension = self.size
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Optional, Tuple, cast
+import math
+from typing import Optional, Tuple
 
 import numpy as np
 from mpl_toolkits.mplot3d import Axes3D
 
+from skspatial._functions import _cross_3d
 from skspatial.objects._base_line_plane import _BaseLinePlane
 from skspatial.objects._mixins import _ToPointsMixin
 from skspatial.objects.line import Line
@@ -127,12 +129,13 @@ class Plane(_BaseLinePlane, _ToPointsMixin):
 
         """
         vector_a = Vector(vector_a)
+        vector_b = Vector(vector_b)
 
         if vector_a.is_parallel(vector_b, **kwargs):
             raise ValueError("The vectors must not be parallel.")
 
-        # The cross product returns a 3D vector.
-        vector_normal = vector_a.cross(vector_b)
+        # Convert to 3D vectors so that the cross product is also 3D.
+        vector_normal = Vector(_cross_3d(vector_a.set_dimension(3), vector_b.set_dimension(3)))
 
         # Convert the point to 3D so that it matches the vector dimension.
         point = Point(point).set_dimension(3)
@@ -181,13 +184,35 @@ class Plane(_BaseLinePlane, _ToPointsMixin):
         ValueError: The points must not be collinear.
 
         """
-        if Points([point_a, point_b, point_c]).are_collinear(**kwargs):
+        points = Points([point_a, point_b, point_c])
+        point_a = Point(point_a)
+
+        # Convert to 3D points so that the cross product is also 3D.
+        if points.dimension != 3:
+            points = points.set_dimension(3)
+            point_a = point_a.set_dimension(3)
+
+        array_a, array_b, array_c = np.asarray(points)
+
+        vector_ab = array_b - array_a
+        vector_ac = array_c - array_a
+        vector_normal = _cross_3d(vector_ab, vector_ac)
+
+        # The points are clearly not collinear if the normal is large relative to the vectors between them.
+        # Otherwise, or if keywords are given, the rank test of Points.are_collinear decides.
+        norm_normal = math.hypot(*vector_normal.tolist())
+        norm_sq_vectors = math.hypot(*vector_ab.tolist(), *vector_ac.tolist()) ** 2
+
+        if (kwargs or norm_normal <= 1e-8 * norm_sq_vectors) and points.are_collinear(**kwargs):
             raise ValueError("The points must not be collinear.")
 
-        vector_ab = Vector.from_points(point_a, point_b)
-        vector_ac = Vector.from_points(point_a, point_c)
+        # This is the check of Vector.is_parallel with its default tolerance, as done by Plane.from_vectors.
+        norm_product = math.hypot(*vector_ab.tolist()) * math.hypot(*vector_ac.tolist())
+
+        if norm_product == 0 or math.isclose(abs(float(vector_ab.dot(vector_ac)) / norm_product), 1):
+            raise ValueError("The vectors must not be parallel.")
 
-        return Plane.from_vectors(point_a, vector_ab, vector_ac)
+        return cls(point_a, vector_normal)
 
     def cartesian(self) -> Tuple[np.int64, np.int64, np.int64, np.int64]:
         """
@@ -230,8 +255,12 @@ class Plane(_BaseLinePlane, _ToPointsMixin):
         if self.dimension > 3:
             raise ValueError("The plane dimension must be <= 3.")
 
-        # The normal must be 3D to extract the coefficients.
-        a, b, c = self.normal.set_dimension(3)
+        if self.dimension == 3:
+            a, b, c = self.normal
+
+        else:
+            # The normal must be 3D to extract the coefficients.
+            a, b, c = self.normal.set_dimension(3)
 
         d = -self.normal.dot(self.point)
 
@@ -264,13 +293,21 @@ class Plane(_BaseLinePlane, _ToPointsMixin):
         Point([5., 9., 0.])
 
         """
-        # Vector from the point in space to the point on the plane.
-        vector_to_plane = Vector.from_points(point, self.point)
+        return Point(self._project_point_array(point))
+
+    def _project_point_array(self, point: array_like) -> np.ndarray:
+        """
+        Project a point onto the plane and return a regular array.
 
-        # Perpendicular vector from the point in space to the plane.
-        vector_projected = self.normal.project_vector(vector_to_plane)
+        Callers convert the result once, since arithmetic with a Point or Vector validates each intermediate result.
+        """
+        point = np.asarray(point)
+        array_normal = np.asarray(self.normal)
+
+        # Signed distance from the point to the plane, scaled by the norm of the normal.
+        distance_scaled = array_normal.dot(point - np.asarray(self.point)) / array_normal.dot(array_normal)
 
-        return cast(Point, Point(point) + vector_projected)
+        return point - distance_scaled * array_normal
 
     def project_points(self, points: array_like) -> Points:
         """
@@ -297,11 +334,18 @@ class Plane(_BaseLinePlane, _ToPointsMixin):
                 [ 1.,  2.,  0.]])
 
         """
-        vectors = np.subtract(self.point, points)
+        points = np.asarray(points)
+        array_normal = np.asarray(self.normal)
 
-        dot_products = np.dot(vectors, self.normal.unit())
+        # Signed distances from the points to the plane, scaled by the norm of the normal.
+        vectors = points - np.asarray(self.point)
+        distances_scaled = np.dot(vectors, array_normal) / array_normal.dot(array_normal)
 
-        return Points(dot_products[:, np.newaxis] * self.normal.unit() + points)
+        # Move each point along the normal, adding the points in place to avoid another array.
+        points_projected = np.multiply.outer(-distances_scaled, array_normal)
+        points_projected += points
+
+        return Points(points_projected)
 
     def project_vector(self, vector: array_like) -> Vector:
         """
@@ -327,10 +371,54 @@ class Plane(_BaseLinePlane, _ToPointsMixin):
         Vector([ 2., -2.,  2.])
 
         """
-        point_in_space = self.point + vector
-        point_on_plane = self.project_point(point_in_space)
+        return Vector(self._project_vector_array(vector))
+
+    def _project_vector_array(self, vector: array_like) -> np.ndarray:
+        """Project a vector onto the plane and return a regular array."""
+        vector = np.asarray(vector)
+        array_normal = np.asarray(self.normal)
+
+        # Remove the component of the vector along the normal.
+        component_normal = array_normal.dot(vector) / array_normal.dot(array_normal)
+
+        return vector - component_normal * array_normal
+
+    def project_vectors(self, vectors: array_like) -> np.ndarray:
+        """
+        Project multiple vectors onto the plane.
+
+        Parameters
+        ----------
+        vectors : array_like
+            (N, D) array of N vectors with dimension D.
+
+        Returns
+        -------
+        np.ndarray
+            (N, D) array of the projections of the vectors onto the plane.
+
+        Examples
+        --------
+        >>> from skspatial.objects import Plane
+
+        >>> plane = Plane([0, 4, 0], [0, 1, 1])
+
+        >>> plane.project_vectors([[2, 4, 8], [0, 1, 1], [1, 0, 0]])
+        array([[ 2., -2.,  2.],
+               [ 0.,  0.,  0.],
+               [ 1.,  0.,  0.]])
+
+        """
+        vectors = np.asarray(vectors)
+        array_normal = np.asarray(self.normal)
+
+        # Remove the component of each vector along the normal, subtracting in place to avoid another array.
+        components_normal = np.dot(vectors, array_normal) / array_normal.dot(array_normal)
 
-        return Vector.from_points(self.point, point_on_plane)
+        vectors_projected = np.multiply.outer(-components_normal, array_normal)
+        vectors_projected += vectors
+
+        return vectors_projected
 
     def project_line(self, line: Line, **kwargs: float) -> Line:
         """
@@ -373,12 +461,12 @@ class Plane(_BaseLinePlane, _ToPointsMixin):
         if self.normal.is_parallel(line.vector, **kwargs):
             raise ValueError("The line and plane must not be perpendicular.")
 
-        point_projected = self.project_point(line.point)
+        point_projected = self._project_point_array(line.point)
 
         if self.normal.is_perpendicular(line.vector, **kwargs):
             return Line(point_projected, line.vector)
 
-        vector_projected = self.project_vector(line.vector)
+        vector_projected = self._project_vector_array(line.vector)
 
         return Line(point_projected, vector_projected)
 
@@ -418,9 +506,7 @@ class Plane(_BaseLinePlane, _ToPointsMixin):
         np.float64(-4.0)
 
         """
-        vector_to_point = Vector.from_points(self.point, point)
-
-        return self.normal.scalar_projection(vector_to_point)
+        return np.float64(self._evaluate_point(point) / math.hypot(*self.normal.tolist()))
 
     def distance_points_signed(self, points: array_like) -> np.ndarray:
         """
@@ -450,9 +536,10 @@ class Plane(_BaseLinePlane, _ToPointsMixin):
         array([ 0.,  1., -4., -4.])
 
         """
-        vectors = np.subtract(points, self.point)
+        vectors = np.subtract(points, np.asarray(self.point))
+        array_normal = np.asarray(self.normal)
 
-        return np.array(np.dot(vectors, self.normal.unit()))
+        return np.dot(vectors, array_normal / math.hypot(*array_normal.tolist()))
 
     def distance_point(self, point: array_like) -> np.float64:
         """
@@ -520,6 +607,43 @@ class Plane(_BaseLinePlane, _ToPointsMixin):
         """
         return np.abs(self.distance_points_signed(point))
 
+    def contains_points(self, points: array_like, abs_tol: float = 0) -> np.ndarray:
+        """
+        Check which of multiple points are contained in the plane.
+
+        Parameters
+        ----------
+        points : array_like
+            Input points.
+        abs_tol : float, optional
+            Absolute tolerance on the distance from a point to the plane (default 0).
+
+        Returns
+        -------
+        np.ndarray
+            Boolean array that is True for each point contained in the plane.
+
+        Examples
+        --------
+        >>> from skspatial.objects import Plane
+
+        >>> plane = Plane([0, 0, 0], [0, 0, 1])
+
+        >>> plane.contains_points([[5, 2, 0], [5, 2, 1], [-3, 4, 0]])
+        array([ True, False,  True])
+
+        >>> plane.contains_points([[5, 2, 1e-9], [5, 2, 1]], abs_tol=1e-6)
+        array([ True, False])
+
+        """
+        points = np.asarray(points)
+
+        # A NaN distance is never within the tolerance, so the point would be reported as not contained.
+        if not np.isfinite(points).all():
+            raise ValueError("The values must all be finite.")
+
+        return self.distance_points(points) <= abs_tol
+
     def side_point(self, point: array_like) -> int:
         """
         Find the side of the plane where a point lies.
@@ -563,7 +687,73 @@ class Plane(_BaseLinePlane, _ToPointsMixin):
         -1
 
         """
-        return int(np.sign(self.distance_point_signed(point)))
+        # Only the sign of n · (x - p) is needed, so the norm of the normal is not computed.
+        value = self._evaluate_point(point)
+
+        return int(value > 0) - int(value < 0)
+
+    def _evaluate_point(self, point: array_like) -> float:
+        """
+        Return the value of n · (x - p) for a single point x, where p is the point on the plane.
+
+        The difference from the plane point is taken first, so the value is exactly zero for x = p.
+        """
+        sequence_point = point.tolist() if isinstance(point, np.ndarray) else point
+
+        # For a flat 3D point, arithmetic with Python scalars is much faster than calling numpy.
+        if self.dimension == 3 and isinstance(sequence_point, (list, tuple)) and len(sequence_point) == 3:
+            a, b, c = self.normal.tolist()
+            x_p, y_p, z_p = self.point.tolist()
+            x, y, z = sequence_point
+
+            try:
+                value = a * (x - x_p) + b * (y - y_p) + c * (z - z_p)
+            except TypeError:
+                # The sequence is not flat, so it is handled by the array path below.
+                pass
+            else:
+                if isinstance(value, (int, float)) and math.isfinite(value):
+                    return value
+
+        # Create a Vector so that invalid input raises the same error as other methods.
+        return self.normal.dot(Vector.from_points(self.point, point))
+
+    def side_points(self, points: array_like) -> np.ndarray:
+        """
+        Find the sides of the plane where multiple points lie.
+
+        Parameters
+        ----------
+        points : array_like
+            Input points.
+
+        Returns
+        -------
+        np.ndarray
+            Array containing, for each point,
+            -1 if the point is behind the plane,
+            0 if the point is on the plane,
+            and 1 if the point is in front of the plane.
+
+        Examples
+        --------
+        >>> from skspatial.objects import Plane
+
+        >>> plane = Plane([0, 0, 0], [0, 0, 1])
+
+        >>> plane.side_points([[2, 5, 0], [1, -5, 6], [5, 8, -4]])
+        array([ 0,  1, -1])
+
+        """
+        points = np.asarray(points)
+
+        # A NaN value is neither positive nor negative, so it would be reported as on the plane.
+        if not np.isfinite(points).all():
+            raise ValueError("The values must all be finite.")
+
+        values = np.dot(points - np.asarray(self.point), np.asarray(self.normal))
+
+        return (values > 0).astype(int) - (values < 0)
 
     def intersect_line(self, line: Line, **kwargs) -> Point:
         """
@@ -613,18 +803,76 @@ class Plane(_BaseLinePlane, _ToPointsMixin):
         ValueError: The line and plane must not be parallel.
 
         """
-        if self.normal.is_perpendicular(line.direction, **kwargs):
+        array_normal = np.asarray(self.normal)
+        denom = array_normal.dot(line.direction)
+
+        # The line is parallel to the plane if its direction is perpendicular to the normal.
+        # This is the same check as Vector.is_perpendicular, but the dot product is reused below.
+        if math.isclose(denom, 0, **kwargs):
             raise ValueError("The line and plane must not be parallel.")
 
-        vector_plane_line = Vector.from_points(self.point, line.point)
+        num = array_normal.dot(np.asarray(self.point) - np.asarray(line.point))
+
+        # Move along the line to the intersection point.
+        return Point(np.asarray(line.point) + (num / denom) * np.asarray(line.direction))
+
+    def intersect_lines(self, points: array_like, directions: array_like, abs_tol: float = 0) -> Points:
+        """
+        Intersect the plane with multiple lines.
+
+        None of the lines may be parallel to the plane.
+
+        Parameters
+        ----------
+        points : array_like
+            (N, D) array of points on the lines.
+        directions : array_like
+            (N, D) array of line directions.
+        abs_tol : float, optional
+            Absolute tolerance used to check if a line direction is perpendicular to the normal (default 0).
+
+        Returns
+        -------
+        Points
+            (N, D) array of intersection points.
+
+        Raises
+        ------
+        ValueError
+            If the points and directions have different shapes.
+            If any of the lines is parallel to the plane.
 
-        num = -self.normal.dot(vector_plane_line)
-        denom = self.normal.dot(line.direction)
+        Examples
+        --------
+        >>> from skspatial.objects import Plane
 
-        # Vector along the line to the intersection point.
-        vector_line_scaled = num / denom * line.direction
+        >>> plane = Plane([0, 0, 1], [0, 0, 1])
 
-        return line.point + vector_line_scaled
+        >>> plane.intersect_lines([[0, 0, 0], [2, 3, 5]], [[0, 0, 1], [1, 0, -1]])
+        Points([[0., 0., 1.],
+                [6., 3., 1.]])
+
+        >>> plane.intersect_lines([[0, 0, 0], [2, 3, 5]], [[0, 0, 1], [1, 0, 0]])
+        Traceback (most recent call last):
+        ...
+        ValueError: The lines and plane must not be parallel.
+
+        """
+        points = np.asarray(points)
+        directions = np.asarray(directions)
+
+        if points.shape != directions.shape:
+            raise ValueError("The points and directions must have the same shape.")
+
+        array_normal = np.asarray(self.normal)
+        denoms = np.dot(directions, array_normal)
+
+        if np.any(np.abs(denoms) <= abs_tol):
+            raise ValueError("The lines and plane must not be parallel.")
+
+        nums = np.dot(np.asarray(self.point) - points, array_normal)
+
+        return Points(points + (nums / denoms)[:, np.newaxis] * directions)
 
     def intersect_plane(self, other: Plane, **kwargs) -> Line:
         """
@@ -678,27 +926,29 @@ class Plane(_BaseLinePlane, _ToPointsMixin):
         ValueError: The planes must not be parallel.
 
         """
-        if self.normal.is_parallel(other.normal, **kwargs):
-            raise ValueError("The planes must not be parallel.")
+        normal_a = np.asarray(self.normal)
+        normal_b = np.asarray(other.normal)
 
-        array_normals_stacked = np.vstack((self.normal, other.normal))
+        norm_sq_a = normal_a.dot(normal_a)
+        norm_sq_b = normal_b.dot(normal_b)
 
-        # Construct a matrix for a linear system.
-        array_00 = 2 * np.eye(3)
-        array_01 = array_normals_stacked.T
-        array_10 = array_normals_stacked
-        array_11 = np.zeros((2, 2))
-        matrix = np.block([[array_00, array_01], [array_10, array_11]])
+        # This is the same check as Vector.is_parallel, but the squared norms are reused below.
+        cos_theta = normal_a.dot(normal_b) / math.sqrt(norm_sq_a * norm_sq_b)
 
-        dot_a = np.dot(self.point, self.normal)
-        dot_b = np.dot(other.point, other.normal)
-        array_y = np.array([0, 0, 0, dot_a, dot_b])
+        is_zero = math.isclose(norm_sq_a, 0, **kwargs) or math.isclose(norm_sq_b, 0, **kwargs)
 
-        # Solve the linear system.
-        solution = np.linalg.solve(matrix, array_y)
+        if is_zero or math.isclose(min(abs(cos_theta), 1), 1, **kwargs):
+            raise ValueError("The planes must not be parallel.")
 
-        point_line = Point(solution[:3])
-        direction_line = self.normal.cross(other.normal)
+        direction_line = _cross_3d(normal_a, normal_b)
+
+        # The point of the line closest to the origin has a closed form in terms of the
+        # plane equations n1 · x = -d1 and n2 · x = -d2, so no linear system is solved.
+        d_a = -normal_a.dot(np.asarray(self.point))
+        d_b = -normal_b.dot(np.asarray(other.point))
+
+        array_combined = d_b * normal_a - d_a * normal_b
+        point_line = _cross_3d(array_combined, direction_line) / direction_line.dot(direction_line)
 
         return Line(point_line, direction_line)
 
@@ -729,7 +979,8 @@ class Plane(_BaseLinePlane, _ToPointsMixin):
         return_error : bool, optional
             If True, also return a value representing the error of the fit (default False).
         kwargs : dict, optional
-            Additional keywords passed to :func:`numpy.linalg.svd`
+            Additional keywords passed to :func:`numpy.linalg.svd`.
+            The keyword ``full_matrices`` defaults to False.
 
         Returns
         -------
@@ -782,6 +1033,9 @@ class Plane(_BaseLinePlane, _ToPointsMixin):
 
         points_centered, centroid = points.mean_center(return_centroid=True)
 
+        # The right singular vectors are not used, so the (N, N) matrix of them is not computed by default.
+        kwargs.setdefault('full_matrices', False)
+
         U, S, _ = np.linalg.svd(points_centered.T, **kwargs)
         normal = Vector(U[:, 2])
 
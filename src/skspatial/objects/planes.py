@@ -0,0 +1,321 @@
+"""Module for the Planes class."""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+
+from skspatial.objects._base_spatial import _BaseSpatial
+from skspatial.objects.plane import Plane
+from skspatial.objects.point import Point
+from skspatial.objects.points import Points
+from skspatial.typing import array_like
+
+
+class Planes(_BaseSpatial):
+    """
+    Multiple planes in space.
+
+    Each plane is defined by a point and a normal vector.
+    The points and normals are stored as contiguous (N, D) arrays,
+    so that a point can be compared with all of the planes at once.
+    The arrays are read-only, so the norms of the normals can be computed once.
+    The normals are vectors rather than points, so they are stored as a regular array.
+
+    Parameters
+    ----------
+    points : array_like
+        (N, D) array of points on the planes.
+    normals : array_like
+        (N, D) array of normal vectors of the planes.
+
+    Attributes
+    ----------
+    points : Points
+        Points on the planes (read-only).
+    normals : np.ndarray
+        Normal vectors of the planes (read-only).
+    dimension : int
+        Dimension of the planes.
+
+    Raises
+    ------
+    ValueError
+        If the points and normals have different shapes.
+        If any normal is the zero vector.
+    TypeError
+        If the index of a plane is not an integer.
+
+    Examples
+    --------
+    >>> from skspatial.objects import Planes
+
+    >>> planes = Planes([[0, 0, 0], [0, 0, 5]], [[0, 0, 1], [1, 0, 0]])
+
+    >>> planes.points
+    Points([[0, 0, 0],
+            [0, 0, 5]])
+
+    >>> planes.normals
+    array([[0, 0, 1],
+           [1, 0, 0]])
+
+    >>> len(planes)
+    2
+
+    >>> planes[1]
+    Plane(point=Point([0, 0, 5]), normal=Vector([1, 0, 0]))
+
+    >>> planes[:1]
+    Traceback (most recent call last):
+    ...
+    TypeError: The index must be an integer.
+
+    >>> Planes([[0, 0, 0]], [[0, 0]])
+    Traceback (most recent call last):
+    ...
+    ValueError: The points and normals must have the same shape.
+
+    >>> Planes([[0, 0, 0], [1, 1, 1]], [[0, 0, 1], [0, 0, 0]])
+    Traceback (most recent call last):
+    ...
+    ValueError: The normals must not be zero vectors.
+
+    """
+
+    def __init__(self, points: array_like, normals: array_like):
+        # Points copies the input arrays, so the planes own their data.
+        # The normals are validated in the same way, then viewed as a regular array.
+        self._points = Points(points)
+        self._normals = np.asarray(Points(normals))
+
+        if self._points.shape != self._normals.shape:
+            raise ValueError("The points and normals must have the same shape.")
+
+        self._points.flags.writeable = False
+        self._normals.flags.writeable = False
+
+        self._point_array = np.asarray(self._points)
+        self._normal_norms = np.linalg.norm(self._normals, axis=1)
+
+        if np.any(self._normal_norms == 0):
+            raise ValueError("The normals must not be zero vectors.")
+
+        self.dimension = self._points.dimension
+
+    @property
+    def points(self) -> Points:
+        """Points on the planes."""
+        return self._points
+
+    @property
+    def normals(self) -> np.ndarray:
+        """Normal vectors of the planes."""
+        return self._normals
+
+    def __repr__(self) -> str:
+        repr_points = np.array_repr(self.points)
+        repr_normals = np.array_repr(self.normals)
+
+        return f"Planes(points={repr_points}, normals={repr_normals})"
+
+    def __len__(self) -> int:
+        return len(self._normal_norms)
+
+    def __getitem__(self, index: int) -> Plane:
+        if not isinstance(index, (int, np.integer)):
+            raise TypeError("The index must be an integer.")
+
+        # Copy the rows so that the plane does not share the read-only arrays.
+        return Plane(self._point_array[index].copy(), self._normals[index].copy())
+
+    @classmethod
+    def from_planes(cls, planes: Sequence[Plane]) -> Planes:
+        """
+        Instantiate multiple planes from a sequence of planes.
+
+        Parameters
+        ----------
+        planes : Sequence
+            Sequence of :class:`Plane` objects.
+
+        Returns
+        -------
+        Planes
+            Planes with the same points and normals as the input planes.
+
+        Examples
+        --------
+        >>> from skspatial.objects import Plane, Planes
+
+        >>> planes = Planes.from_planes([Plane([0, 0, 0], [0, 0, 1]), Plane([1, 2, 3], [0, 1, 0])])
+
+        >>> planes.points
+        Points([[0, 0, 0],
+                [1, 2, 3]])
+
+        >>> planes.normals
+        array([[0, 0, 1],
+               [0, 1, 0]])
+
+        """
+        return cls([plane.point for plane in planes], [plane.normal for plane in planes])
+
+    def distance_point_signed(self, point: array_like) -> np.ndarray:
+        """
+        Return the signed distances from a point to each plane.
+
+        Parameters
+        ----------
+        point : array_like
+            Input point.
+
+        Returns
+        -------
+        np.ndarray
+            Signed distance from the point to each plane.
+
+        Examples
+        --------
+        >>> from skspatial.objects import Planes
+
+        >>> planes = Planes([[0, 0, 0], [0, 0, 5], [1, 0, 0]], [[0, 0, 1], [0, 0, 2], [-1, 0, 0]])
+
+        >>> planes.distance_point_signed([5, 2, 1])
+        array([ 1., -4., -4.])
+
+        """
+        return self._evaluate_point(point) / self._normal_norms
+
+    def distance_point(self, point: array_like) -> np.ndarray:
+        """
+        Return the distances from a point to each plane.
+
+        Parameters
+        ----------
+        point : array_like
+            Input point.
+
+        Returns
+        -------
+        np.ndarray
+            Distance from the point to each plane.
+
+        Examples
+        --------
+        >>> from skspatial.objects import Planes
+
+        >>> planes = Planes([[0, 0, 0], [0, 0, 5], [1, 0, 0]], [[0, 0, 1], [0, 0, 2], [-1, 0, 0]])
+
+        >>> planes.distance_point([5, 2, 1])
+        array([1., 4., 4.])
+
+        """
+        return np.abs(self.distance_point_signed(point))
+
+    def contains_point(self, point: array_like, abs_tol: float = 0) -> np.ndarray:
+        """
+        Check which planes contain a point.
+
+        Parameters
+        ----------
+        point : array_like
+            Input point.
+        abs_tol : float, optional
+            Absolute tolerance on the distance from the point to a plane (default 0).
+
+        Returns
+        -------
+        np.ndarray
+            Boolean array that is True for each plane containing the point.
+
+        Examples
+        --------
+        >>> from skspatial.objects import Planes
+
+        >>> planes = Planes([[0, 0, 0], [0, 0, 5], [1, 0, 0]], [[0, 0, 1], [0, 0, 2], [-1, 0, 0]])
+
+        >>> planes.contains_point([1, 2, 0])
+        array([ True, False,  True])
+
+        >>> planes.contains_point([1, 2, 1e-9], abs_tol=1e-6)
+        array([ True, False,  True])
+
+        """
+        return self.distance_point(point) <= abs_tol
+
+    def side_point(self, point: array_like) -> np.ndarray:
+        """
+        Find the side of each plane where a point lies.
+
+        Parameters
+        ----------
+        point : array_like
+            Input point.
+
+        Returns
+        -------
+        np.ndarray
+            Array containing, for each plane,
+            -1 if the point is behind the plane,
+            0 if the point is on the plane,
+            and 1 if the point is in front of the plane.
+
+        Examples
+        --------
+        >>> from skspatial.objects import Planes
+
+        >>> planes = Planes([[0, 0, 0], [0, 0, 5], [1, 0, 0]], [[0, 0, 1], [0, 0, 2], [-1, 0, 0]])
+
+        >>> planes.side_point([5, 2, 1])
+        array([ 1, -1, -1])
+
+        >>> planes.side_point([1, 2, 0])
+        array([ 0, -1,  0])
+
+        """
+        values = self._evaluate_point(point)
+
+        return (values > 0).astype(int) - (values < 0)
+
+    def project_point(self, point: array_like) -> Points:
+        """
+        Project a point onto each plane.
+
+        Parameters
+        ----------
+        point : array_like
+            Input point.
+
+        Returns
+        -------
+        Points
+            Projection of the point onto each plane.
+
+        Examples
+        --------
+        >>> from skspatial.objects import Planes
+
+        >>> planes = Planes([[0, 0, 0], [0, 0, 5], [1, 0, 0]], [[0, 0, 1], [0, 0, 2], [-1, 0, 0]])
+
+        >>> planes.project_point([5, 2, 1])
+        Points([[5., 2., 0.],
+                [5., 2., 5.],
+                [1., 2., 1.]])
+
+        """
+        # Each projection is x - ((n · (x - p)) / (n · n)) n.
+        distances_scaled = self._evaluate_point(point) / self._normal_norms**2
+
+        return Points(np.asarray(point) - distances_scaled[:, np.newaxis] * self._normals)
+
+    def _evaluate_point(self, point: array_like) -> np.ndarray:
+        """
+        Return n · (x - p) for a point x and each plane with point p and normal n.
+
+        The difference from each plane point is taken first, so the value is exactly zero for x = p.
+        """
+        vectors = np.asarray(Point(point)) - self._point_array
+
+        return np.einsum('ij,ij->i', vectors, self._normals)
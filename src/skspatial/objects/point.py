@@ -1,5 +1,7 @@
 """Module for the Point class."""
 
+import math
+
 import numpy as np
 from matplotlib.axes import Axes
 from mpl_toolkits.mplot3d import Axes3D
@@ -94,9 +96,30 @@ class Point(_BaseArray1D):
         np.float64(3.0)
 
         """
-        vector = Vector.from_points(self, other)
-
-        return vector.norm()
+        sequence_other = other.tolist() if isinstance(other, np.ndarray) else other
+
+        # For a point given as a flat sequence, math.dist computes the distance without creating any arrays.
+        if isinstance(sequence_other, (list, tuple)) and len(sequence_other) == self.size:
+            try:
+                distance = math.dist(self.tolist(), sequence_other)
+            except TypeError:
+                # The sequence is not flat, so it is handled by the array path below.
+                pass
+            else:
+                if math.isfinite(distance):
+                    return np.float64(distance)
+
+        # Subtract regular arrays so that no Vector is created, since creating one validates the array.
+        array_vector = np.subtract(other, np.asarray(self), dtype=np.float64)
+
+        if array_vector.ndim == 1:
+            distance_sq = array_vector.dot(array_vector)
+
+            if math.isfinite(distance_sq):
+                return np.float64(math.sqrt(distance_sq))
+
+        # Validate the vector so that invalid input raises the same error as a Vector.
+        return Vector(array_vector).norm()
 
     def plot_2d(self, ax_2d: Axes, **kwargs) -> None:
         """
@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-from typing import cast
-
 import numpy as np
 from matplotlib.axes import Axes
 from mpl_toolkits.mplot3d import Axes3D
@@ -12,6 +10,12 @@ from numpy.linalg import matrix_rank
 from skspatial.objects._base_array import _BaseArray2D
 from skspatial.objects.point import Point
 from skspatial.plotting import _scatter_2d, _scatter_3d
+from skspatial.typing import array_like
+
+# Points.distance_point uses row-wise dot products below this number of points, and loops over the columns otherwise.
+# In 2D and 3D, the row-wise path was faster up to 128 points (about 6 us against 7 us),
+# and the column-wise path was faster from 256 points (about 7-9 us against 7.5-11 us).
+_N_POINTS_COLUMN_WISE = 256
 
 
 class Points(_BaseArray2D):
@@ -50,13 +54,22 @@ class Points(_BaseArray2D):
     >>> points.mean(axis=0)
     array([3. , 3. , 1.5])
 
+    The data type of the input array is kept.
+    Single precision halves the memory of large point clouds,
+    and the batched distance methods return single precision distances for these points.
+
+    >>> import numpy as np
+
+    >>> points_32 = Points(np.array([[0, 0, 0], [1, 2, 2]], dtype=np.float32))
+
+    >>> points_32.distance_point([0, 0, 0])
+    array([0., 3.], dtype=float32)
+
     >>> Points([[]])
     Traceback (most recent call last):
     ...
     ValueError: The array must not be empty.
 
-    >>> import numpy as np
-
     >>> Points([[1, 2], [1, np.nan]])
     Traceback (most recent call last):
     ...
@@ -91,7 +104,18 @@ class Points(_BaseArray2D):
                 [2, 3, 4]])
 
         """
-        return Points(np.unique(self, axis=0))
+        array = np.asarray(self)
+
+        # Sort the rows lexicographically, which gives the same order as np.unique(axis=0).
+        # This avoids the structured view and extra copies used by np.unique for 2D arrays.
+        array_sorted = array[np.lexsort(array.T[::-1])]
+
+        # Keep the first row and each row that differs from the previous one.
+        is_new = np.empty(len(array_sorted), dtype=bool)
+        is_new[0] = True
+        np.any(array_sorted[1:] != array_sorted[:-1], axis=1, out=is_new[1:])
+
+        return Points(array_sorted[is_new])
 
     def centroid(self) -> Point:
         """
@@ -110,9 +134,7 @@ class Points(_BaseArray2D):
         Point([1.5, 2. , 3. ])
 
         """
-        centroid_ = cast(np.ndarray, self.mean(axis=0))
-
-        return Point(centroid_)
+        return Point(_mean_rows(np.asarray(self)))
 
     def mean_center(self, return_centroid: bool = False):
         """
@@ -148,11 +170,13 @@ class Points(_BaseArray2D):
         Point([0., 0., 0.])
 
         """
-        centroid = self.centroid()
-        points_centered: Points = self - centroid
+        # Subtract with regular arrays so that only the final result is converted to Points.
+        array = np.asarray(self)
+        array_centroid = _mean_rows(array)
+        points_centered = Points(array - array_centroid)
 
         if return_centroid:
-            return points_centered, centroid
+            return points_centered, Point(array_centroid)
 
         return points_centered
 
@@ -190,6 +214,111 @@ class Points(_BaseArray2D):
 
         return self / distances_to_points.max()
 
+    def distance_point(self, point: array_like) -> np.ndarray:
+        """
+        Return the distances from the points to another point.
+
+        Parameters
+        ----------
+        point : array_like
+            Other point.
+
+        Returns
+        -------
+        np.ndarray
+            (N,) array of the distances from the N points to the other point.
+
+        Raises
+        ------
+        ValueError
+            If the other point does not have the same dimension as the points.
+
+        Examples
+        --------
+        >>> from skspatial.objects import Points
+
+        >>> points = Points([[0, 0, 0], [1, 2, 2], [3, 0, 4]])
+
+        >>> points.distance_point([0, 0, 0])
+        array([0., 3., 5.])
+
+        >>> points.distance_point([1, 2, 2]).round(3)
+        array([3.   , 0.   , 3.464])
+
+        >>> points.distance_point([0, 0])
+        Traceback (most recent call last):
+        ...
+        ValueError: The point must have the same dimension as the points.
+
+        """
+        # The query point is cast to the floating dtype of the points, so float32 points stay in float32.
+        dtype = np.result_type(self.dtype, np.float32)
+        array = np.asarray(self, dtype=dtype)
+        array_point = np.asarray(point, dtype=dtype)
+
+        if array_point.shape != (self.dimension,):
+            raise ValueError("The point must have the same dimension as the points.")
+
+        if len(array) < _N_POINTS_COLUMN_WISE:
+            # For few points, the row-wise dot products need the fewest NumPy calls.
+            vectors = array - array_point
+            return np.sqrt(np.einsum('ij,ij->i', vectors, vectors))
+
+        # For many points, the squared distances are accumulated one coordinate at a time.
+        # Each step loops over a whole column, which is faster than many short loops over rows of length D,
+        # whether the array is stored in row-major or column-major order.
+        columns = array.T
+        coords = array_point.tolist()
+
+        distances = np.square(columns[0] - coords[0])
+
+        for column, coord in zip(columns[1:], coords[1:]):
+            differences = column - coord
+            differences *= differences
+            distances += differences
+
+        return np.sqrt(distances, out=distances)
+
+    def pairwise_distance(self) -> np.ndarray:
+        """
+        Return the distances between all pairs of points.
+
+        The squared distances are computed as ``p · p + q · q - 2 p · q`` with one matrix product,
+        so no (N, N, D) array of differences is created.
+        The points are mean-centered first to reduce the rounding error of this expansion.
+
+        Returns
+        -------
+        np.ndarray
+            (N, N) array of distances, where element (i, j) is the distance from point i to point j.
+
+        Examples
+        --------
+        >>> from skspatial.objects import Points
+
+        >>> points = Points([[0, 0], [3, 4], [0, 4]])
+
+        >>> points.pairwise_distance()
+        array([[0., 5., 4.],
+               [5., 0., 3.],
+               [4., 3., 0.]])
+
+        """
+        array_centered = np.asarray(self) - _mean_rows(np.asarray(self))
+
+        norms_sq = np.einsum('ij,ij->i', array_centered, array_centered)
+
+        distances_sq = array_centered @ array_centered.T
+        distances_sq *= -2
+        distances_sq += norms_sq[:, np.newaxis]
+        distances_sq += norms_sq
+
+        # Rounding can make some squared distances slightly negative, and the diagonal is exactly zero.
+        np.maximum(distances_sq, 0, out=distances_sq)
+        np.fill_diagonal(distances_sq, 0)
+
+        return np.sqrt(distances_sq, out=distances_sq)
+
     def affine_rank(self, **kwargs) -> np.int64:
         """
         Return the affine rank of the points.
@@ -234,9 +363,25 @@ class Points(_BaseArray2D):
 
         """
         # Remove duplicate points so they do not affect the centroid.
-        points_centered = self.unique().mean_center()
+        array_unique = np.asarray(self.unique())
+        n_unique = array_unique.shape[0]
+
+        # The rank of a single point is zero for any tolerance,
+        # and two distinct points have rank one with the default tolerance of matrix_rank.
+        if n_unique == 1:
+            return np.intp(0)
 
-        return matrix_rank(points_centered, **kwargs)
+        if n_unique == 2 and not kwargs:
+            return np.intp(1)
+
+        # The centered points are only passed to matrix_rank, so they are not converted to Points.
+        array_centered = array_unique - _mean_rows(array_unique)
+
+        # The singular values are unchanged by a transpose, and the SVD is faster on a tall matrix.
+        if array_centered.shape[0] < array_centered.shape[1]:
+            array_centered = array_centered.T
+
+        return matrix_rank(array_centered, **kwargs)
 
     def are_concurrent(self, **kwargs) -> bool:
         """
@@ -263,6 +408,12 @@ class Points(_BaseArray2D):
         True
 
         """
+        if not kwargs:
+            # Without a tolerance, the rank is zero exactly when all points are equal,
+            # which is checked in one pass without sorting or a decomposition.
+            array = np.asarray(self)
+            return not (array != array[0]).any()
+
         return bool(self.affine_rank(**kwargs) == 0)
 
     def are_collinear(self, **kwargs) -> bool:
@@ -293,6 +444,9 @@ class Points(_BaseArray2D):
         False
 
         """
+        if len(self) <= 2:
+            return True
+
         return bool(self.affine_rank(**kwargs) <= 1)
 
     def are_coplanar(self, **kwargs) -> bool:
@@ -323,6 +477,9 @@ class Points(_BaseArray2D):
         False
 
         """
+        if len(self) <= 3:
+            return True
+
         return bool(self.affine_rank(**kwargs) <= 2)
 
     def plot_2d(self, ax_2d: Axes, **kwargs) -> None:
@@ -381,3 +538,25 @@ class Points(_BaseArray2D):
 
         """
         _scatter_3d(ax_3d, self, **kwargs)
+
+
+def _mean_rows(array: np.ndarray) -> np.ndarray:
+    """
+    Return the mean of the rows of a 2D array.
+
+    For a tall and narrow array of points, a matrix-vector product with a vector of ones
+    is much faster than ``array.mean(axis=0)``, which reduces each column with a strided loop.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from skspatial.objects.points import _mean_rows
+
+    >>> _mean_rows(np.array([[1, 2, 3], [2, 2, 3]]))
+    array([1.5, 2. , 3. ])
+
+    """
+    n_rows = array.shape[0]
+    ones = np.ones(n_rows, dtype=np.result_type(array.dtype, np.float32))
+
+    return ones @ array / n_rows
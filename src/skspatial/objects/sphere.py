@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import math
+from functools import lru_cache
 from typing import Tuple
 
 import numpy as np
@@ -14,7 +15,6 @@ from skspatial.objects._mixins import _ToPointsMixin
 from skspatial.objects.line import Line
 from skspatial.objects.point import Point
 from skspatial.objects.points import Points
-from skspatial.objects.vector import Vector
 from skspatial.typing import array_like
 
 
@@ -167,23 +167,112 @@ class Sphere(_BaseSphere, _ToPointsMixin):
         ValueError: The line does not intersect the sphere.
 
         """
-        vector_to_line = Vector.from_points(self.point, line.point)
-        vector_unit = line.direction.unit()
+        # Use regular arrays and Python floats so that only the two output points are validated.
+        array_point = np.asarray(line.point)
+        array_direction = np.asarray(line.direction)
 
-        dot = vector_unit.dot(vector_to_line)
+        vector_to_line = array_point - np.asarray(self.point)
+        vector_unit = array_direction / math.sqrt(array_direction.dot(array_direction))
 
-        discriminant = dot**2 - (vector_to_line.norm() ** 2 - self.radius**2)
+        dot = float(vector_unit.dot(vector_to_line))
+
+        discriminant = dot**2 - (float(vector_to_line.dot(vector_to_line)) - self.radius**2)
 
         if discriminant < 0:
             raise ValueError("The line does not intersect the sphere.")
 
-        pm = np.array([-1, 1])  # Array to compute minus/plus.
-        distances = -dot + pm * math.sqrt(discriminant)
+        root = math.sqrt(discriminant)
 
-        point_a, point_b = line.point + distances.reshape(-1, 1) * vector_unit
+        point_a = array_point + (-dot - root) * vector_unit
+        point_b = array_point + (-dot + root) * vector_unit
 
         return Point(point_a), Point(point_b)
 
+    def intersect_lines(
+        self,
+        points: array_like,
+        directions: array_like,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Intersect the sphere with multiple lines.
+
+        Each line is defined by a point and a direction vector.
+        All lines are intersected at once, without creating a :class:`Line` for each one.
+
+        Parameters
+        ----------
+        points : array_like
+            (N, 3) array of points on the lines.
+        directions : array_like
+            (N, 3) array of direction vectors of the lines.
+
+        Returns
+        -------
+        points_a, points_b : np.ndarray
+            (N, 3) arrays of the first and second points of intersection.
+            The rows for lines that do not intersect the sphere are NaN.
+        is_intersecting : np.ndarray
+            (N,) boolean array that is True for each line that intersects the sphere.
+
+        Raises
+        ------
+        ValueError
+            If the points and directions have different shapes.
+            If any direction is the zero vector.
+
+        Examples
+        --------
+        >>> from skspatial.objects import Sphere
+
+        >>> sphere = Sphere([0, 0, 0], 1)
+
+        >>> points_a, points_b, is_intersecting = sphere.intersect_lines(
+        ...     [[0, 0, 0], [0, 0, 1], [0, 0, 2]],
+        ...     [[1, 0, 0], [1, 0, 0], [1, 0, 0]],
+        ... )
+
+        >>> points_a
+        array([[-1.,  0.,  0.],
+               [ 0.,  0.,  1.],
+               [nan, nan, nan]])
+
+        >>> points_b
+        array([[ 1.,  0.,  0.],
+               [ 0.,  0.,  1.],
+               [nan, nan, nan]])
+
+        >>> is_intersecting
+        array([ True,  True, False])
+
+        """
+        array_points = np.asarray(Points(points), dtype=np.float64)
+        array_directions = np.asarray(Points(directions), dtype=np.float64)
+
+        if array_points.shape != array_directions.shape:
+            raise ValueError("The points and directions must have the same shape.")
+
+        norms_directions = np.linalg.norm(array_directions, axis=1)
+
+        if np.any(norms_directions == 0):
+            raise ValueError("The directions must not be zero vectors.")
+
+        vectors_unit = array_directions / norms_directions[:, np.newaxis]
+        vectors_to_lines = array_points - np.asarray(self.point)
+
+        dots = np.einsum('ij,ij->i', vectors_unit, vectors_to_lines)
+        discriminants = dots**2 - (np.einsum('ij,ij->i', vectors_to_lines, vectors_to_lines) - self.radius**2)
+
+        is_intersecting = discriminants >= 0
+
+        # The square root of a negative discriminant is NaN, which marks the lines that miss the sphere.
+        with np.errstate(invalid='ignore'):
+            roots = np.sqrt(discriminants)
+
+        points_a = array_points + (-dots - roots)[:, np.newaxis] * vectors_unit
+        points_b = array_points + (-dots + roots)[:, np.newaxis] * vectors_unit
+
+        return points_a, points_b, is_intersecting
+
     @classmethod
     def best_fit(cls, points: array_like) -> Sphere:
         """
@@ -286,18 +375,20 @@ class Sphere(_BaseSphere, _ToPointsMixin):
                [-1.   , -1.   , -1.   , -1.   , -1.   ]])
 
         """
-        angles_a = np.linspace(0, np.pi, n_angles)
-        angles_b = np.linspace(0, 2 * np.pi, n_angles)
+        sin_angles_a, cos_angles_a, sin_angles_b, cos_angles_b = _mesh_angles(n_angles)
 
-        sin_angles_a = np.sin(angles_a)
-        cos_angles_a = np.cos(angles_a)
+        # The radius is applied to the column of angles so the outer products need no further scaling.
+        radius_sin_angles_a = self.radius * sin_angles_a[:, np.newaxis]
+        radius_cos_angles_a = self.radius * cos_angles_a[:, np.newaxis]
 
-        sin_angles_b = np.sin(angles_b)
-        cos_angles_b = np.cos(angles_b)
+        # The three coordinate matrices are written into one buffer, then shifted by the center in place.
+        mesh = np.empty((3, n_angles, n_angles))
+        np.multiply(radius_sin_angles_a, sin_angles_b, out=mesh[0])
+        np.multiply(radius_sin_angles_a, cos_angles_b, out=mesh[1])
+        mesh[2] = radius_cos_angles_a
+        mesh += np.asarray(self.point)[:, np.newaxis, np.newaxis]
 
-        X = self.point[0] + self.radius * np.outer(sin_angles_a, sin_angles_b)
-        Y = self.point[1] + self.radius * np.outer(sin_angles_a, cos_angles_b)
-        Z = self.point[2] + self.radius * np.outer(cos_angles_a, np.ones_like(angles_b))
+        X, Y, Z = mesh
 
         return X, Y, Z
 
@@ -334,3 +425,38 @@ class Sphere(_BaseSphere, _ToPointsMixin):
         X, Y, Z = self.to_mesh(n_angles)
 
         ax_3d.plot_surface(X, Y, Z, **kwargs)
+
+
+@lru_cache(maxsize=16)
+def _mesh_angles(n_angles: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Return the sines and cosines of the angles used for a sphere mesh.
+
+    The arrays only depend on the number of angles, so they are cached and shared between spheres.
+    They are read-only to protect the cached values.
+
+    Examples
+    --------
+    >>> from skspatial.objects.sphere import _mesh_angles
+
+    >>> sin_angles_a, cos_angles_a, sin_angles_b, cos_angles_b = _mesh_angles(3)
+
+    >>> cos_angles_a.round(3)
+    array([ 1.,  0., -1.])
+
+    >>> cos_angles_b.round(3)
+    array([ 1., -1.,  1.])
+
+    >>> sin_angles_a.flags.writeable
+    False
+
+    """
+    angles_a = np.linspace(0, np.pi, n_angles)
+    angles_b = np.linspace(0, 2 * np.pi, n_angles)
+
+    arrays = np.sin(angles_a), np.cos(angles_a), np.sin(angles_b), np.cos(angles_b)
+
+    for array in arrays:
+        array.flags.writeable = False
+
+    return arrays
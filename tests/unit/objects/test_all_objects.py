@@ -1,6 +1,6 @@
 import numpy as np
 import pytest
-from skspatial.objects import Circle, Cylinder, Line, Plane, Point, Points, Sphere, Triangle, Vector
+from skspatial.objects import Circle, Cylinder, Line, Plane, Planes, Point, Points, Sphere, Triangle, Vector
 from skspatial.objects.line_segment import LineSegment
 
 
@@ -23,6 +23,7 @@ from skspatial.objects.line_segment import LineSegment
         (LineSegment([-1, 2, 3], [5, 4, 2]), "LineSegment(point_a=Point([-1,  2,  3]), point_b=Point([5, 4, 2]))"),
         (Plane([0, 0], [1, 0]), "Plane(point=Point([0, 0]), normal=Vector([1, 0]))"),
         (Plane([-1, 2, 3], [5, 4, 2]), "Plane(point=Point([-1,  2,  3]), normal=Vector([5, 4, 2]))"),
+        (Planes([[0, 0]], [[1, 0]]), "Planes(points=Points([[0, 0]]), normals=array([[1, 0]]))"),
         (Circle([0, 0], 1), "Circle(point=Point([0, 0]), radius=1)"),
         (Circle([0, 0], 2.5), "Circle(point=Point([0, 0]), radius=2.5)"),
         (Sphere([0, 0, 0], 1), "Sphere(point=Point([0, 0, 0]), radius=1)"),
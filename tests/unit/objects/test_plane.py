@@ -3,7 +3,7 @@ import math
 import numpy as np
 import pytest
 from skspatial._functions import _allclose
-from skspatial.objects import Line, Plane, Points
+from skspatial.objects import Line, Plane, Point, Points
 
 
 @pytest.mark.parametrize(
@@ -64,6 +64,23 @@ def test_from_points(point_a, point_b, point_c, plane_expected):
     assert plane.is_close(plane_expected)
 
 
+@pytest.mark.parametrize(
+    ("point_a", "point_b", "point_c"),
+    [
+        ([0, 0, 0], [1, 0, 0], [1, 1e-6, 0]),
+        ([0, 0, 0], [1, 0, 0], [-1, 1e-6, 0]),
+        ([5, 5, 5], [6, 5, 5], [7, 5, 5 + 1e-6]),
+    ],
+)
+def test_from_points_nearly_parallel(point_a, point_b, point_c):
+    # The vectors between the points are parallel within the default tolerance of Vector.is_parallel,
+    # but the points are not collinear by the rank test.
+    assert not Points([point_a, point_b, point_c]).are_collinear()
+
+    with pytest.raises(ValueError, match="The vectors must not be parallel."):
+        Plane.from_points(point_a, point_b, point_c)
+
+
 @pytest.mark.parametrize(
     ("point_a", "point_b", "point_c"),
     [
@@ -172,6 +189,21 @@ def test_project_vector(plane, vector, vector_expected):
     assert vector_projected.is_close(vector_expected)
 
 
+@pytest.mark.parametrize(
+    ("plane", "vectors"),
+    [
+        (Plane([0, 0, 0], [0, 0, 1]), [[1, 1, 0], [1, 1, 1], [7, -5, 20]]),
+        (Plane([0, 0, 0], [0, 0, -10]), [[7, -5, 20], [0, 0, 3]]),
+        (Plane([1, 2, 3], [1, -1, 2]), [[7, -5, 20], [1, -1, 2], [0.5, 3, -1]]),
+        (Plane([0, 0], [1, 1]), [[1, 0], [-2, 5]]),
+    ],
+)
+def test_project_vectors(plane, vectors):
+    vectors_expected = [plane.project_vector(vector) for vector in vectors]
+
+    assert np.allclose(plane.project_vectors(vectors), vectors_expected)
+
+
 @pytest.mark.parametrize(
     ("plane", "line", "line_expected"),
     [
@@ -274,6 +306,79 @@ def test_distance_points(points, plane):
     assert np.allclose(distances, distances_expected)
 
 
+def test_distance_point_after_modification():
+    plane = Plane([0, 0, 0], [0, 0, 1])
+    plane.point[2] = 5
+
+    assert plane.distance_point_signed([0, 0, 5]) == 0
+    assert plane.cartesian()[3] == -5
+
+    plane = Plane([0, 0, 0], [0, 0, 1])
+    plane.point = Point([0, 0, 5])
+
+    assert plane.distance_point_signed([0, 0, 5]) == 0
+    assert plane.distance_points_signed([[0, 0, 5], [0, 0, 7]]).tolist() == [0, 2]
+    assert plane.cartesian()[3] == -5
+
+    plane = Plane([0, 0, 0], [0, 0, 1])
+    plane.normal[:] = [0, 2, 0]
+
+    assert plane.distance_point_signed([0, 3, 5]) == 3
+    assert plane.project_point([0, 3, 5]).is_equal([0, 0, 5])
+
+
+@pytest.mark.parametrize(
+    ("plane", "point"),
+    [
+        (Plane([0, 0, 0], [0, 0, 1]), [np.nan, 0, 0]),
+        (Plane([0, 0, 0], [0, 0, 1]), [0, 0, np.inf]),
+        (Plane([0, 0, 0], [0, 0, 1]), np.array([0, -np.inf, 0])),
+        (Plane([0, 0], [0, 1]), [np.nan, 0]),
+        (Plane([0, 0, 0, 0], [0, 0, 0, 1]), [0, 0, 0, np.inf]),
+    ],
+)
+def test_distance_point_failure(plane, point):
+    message_expected = "The values must all be finite."
+
+    with pytest.raises(ValueError, match=message_expected):
+        plane.distance_point_signed(point)
+
+    with pytest.raises(ValueError, match=message_expected):
+        plane.distance_point(point)
+
+    with pytest.raises(ValueError, match=message_expected):
+        plane.contains_point(point)
+
+
+@pytest.mark.parametrize(
+    ("point", "message_expected"),
+    [
+        ([[1], [2], [3]], "The array must be 1D."),
+        (np.array([[1], [2], [3]]), "The array must be 1D."),
+        ([1, 2], "could not be broadcast together"),
+        ([1, 2, 3, 4], "could not be broadcast together"),
+    ],
+)
+def test_single_point_shape_failure(point, message_expected):
+    plane = Plane([0, 0, 0], [0, 0, 1])
+
+    with pytest.raises(ValueError, match=message_expected):
+        plane.distance_point_signed(point)
+
+    with pytest.raises(ValueError, match=message_expected):
+        plane.contains_point(point)
+
+    with pytest.raises(ValueError, match=message_expected):
+        plane.side_point(point)
+
+
+def test_distance_points_far_from_origin():
+    plane = Plane([1e8, 1e8, 1e8], [1, 2, 3])
+    points = plane.point + 1e-3 * plane.normal.unit() * np.array([[1], [-2], [0]])
+
+    assert np.allclose(plane.distance_points_signed(points), [1e-3, -2e-3, 0], rtol=1e-5, atol=0)
+
+
 @pytest.mark.parametrize(
     ("plane", "point", "value_expected"),
     [
@@ -295,6 +400,92 @@ def test_side_point(plane, point, value_expected):
     assert plane.side_point(point) == value_expected
 
 
+@pytest.mark.parametrize(
+    ("point", "normal"),
+    np.random.default_rng(0).uniform(-100, 100, size=(50, 2, 3)).tolist(),
+)
+def test_plane_point_on_plane(point, normal):
+    plane = Plane(point, normal)
+
+    assert plane.distance_point_signed(plane.point) == 0
+    assert plane.contains_point(plane.point)
+    assert plane.side_point(plane.point) == 0
+
+
+@pytest.mark.parametrize(
+    ("plane", "points"),
+    [
+        (Plane([0, 0], [1, 1]), [[2, 2], [0, 0], [-1, -3]]),
+        (Plane([0, 0, 0], [1, 0, 0]), [[0, 0, 0], [1, 0, 0], [-1, 0, 0], [0, 38, 19]]),
+        (Plane([5, 0, 0], [-1, 2, 0]), [[1, 0, 0], [25, 53, -105], [5, 0, 7]]),
+    ],
+)
+def test_side_points(plane, points):
+    values_expected = [plane.side_point(point) for point in points]
+
+    assert np.array_equal(plane.side_points(points), values_expected)
+
+
+@pytest.mark.parametrize(
+    ("plane", "point"),
+    [
+        (Plane([0, 0, 0], [0, 0, 1]), [np.nan, 0, 0]),
+        (Plane([0, 0, 0], [0, 0, 1]), [np.inf, 0, 0]),
+        (Plane([0, 0, 0], [0, 0, 1]), [0, 0, -np.inf]),
+        (Plane([0, 0], [1, 1]), [np.nan, np.nan]),
+    ],
+)
+def test_side_point_failure(plane, point):
+    message_expected = "The values must all be finite."
+
+    with pytest.raises(ValueError, match=message_expected):
+        plane.side_point(point)
+
+    with pytest.raises(ValueError, match=message_expected):
+        plane.side_points([np.zeros(plane.dimension), point])
+
+
+@pytest.mark.parametrize(
+    ("plane", "points", "abs_tol"),
+    [
+        (Plane([0, 0], [1, 1]), [[2, -2], [0, 0], [-1, -3]], 0),
+        (Plane([0, 0, 0], [1, 0, 0]), [[0, 0, 0], [1e-9, 0, 0], [-1, 0, 0], [0, 38, 19]], 0),
+        (Plane([0, 0, 0], [1, 0, 0]), [[0, 0, 0], [1e-9, 0, 0], [-1, 0, 0], [0, 38, 19]], 1e-6),
+        (Plane([5, 0, 0], [-1, 2, 0]), [[1, 0, 0], [25, 10, -105], [5, 0, 7]], 1e-6),
+    ],
+)
+def test_contains_points(plane, points, abs_tol):
+    bools_expected = [plane.contains_point(point, abs_tol=abs_tol) for point in points]
+
+    assert np.array_equal(plane.contains_points(points, abs_tol=abs_tol), bools_expected)
+
+
+@pytest.mark.parametrize(
+    "points",
+    [
+        [[0, 0, np.nan], [0, 0, 0]],
+        [[0, 0, 0], [np.inf, 0, 0]],
+        np.array([[0, -np.inf, 0]]),
+    ],
+)
+def test_contains_points_failure(points):
+    plane = Plane([0, 0, 0], [0, 0, 1])
+
+    with pytest.raises(ValueError, match="The values must all be finite."):
+        plane.contains_points(points)
+
+
+@pytest.mark.parametrize(
+    ("point", "normal"),
+    np.random.default_rng(1).uniform(-100, 100, size=(50, 2, 3)).tolist(),
+)
+def test_contains_points_plane_point(point, normal):
+    plane = Plane(point, normal)
+    points = [plane.point, plane.point + [10.5, 0, 0]]
+
+    assert np.array_equal(plane.contains_points(points), [True, False])
+
+
 @pytest.mark.parametrize(
     ("line", "plane", "array_expected"),
     [
@@ -323,6 +514,51 @@ def test_intersect_line_failure(line, plane):
         plane.intersect_line(line)
 
 
+@pytest.mark.parametrize(
+    ("plane", "points", "directions"),
+    [
+        (Plane([0, 0, 0], [0, 0, 1]), [[0, 0, 0], [1, 2, 3]], [[0, 0, 1], [1, 1, 1]]),
+        (Plane([2, -53, -7], [0, 0, 5]), [[0, 0, 0], [4, -1, 2]], [[0, 0, -1], [-3, 2, 8]]),
+        (Plane([1, 2, 3], [1, -1, 2]), [[5, 5, 5], [0, 0, 0], [1, 0, 0]], [[1, 2, 3], [0, 1, 1], [2, 0, 1]]),
+    ],
+)
+def test_intersect_lines(plane, points, directions):
+    points_intersection = plane.intersect_lines(points, directions)
+
+    points_expected = [plane.intersect_line(Line(point, direction)) for point, direction in zip(points, directions)]
+
+    assert np.allclose(points_intersection, points_expected)
+
+
+@pytest.mark.parametrize(
+    ("plane", "points", "directions", "message_expected"),
+    [
+        (Plane([0, 0, 0], [0, 0, 1]), [[0, 0, 0]], [[1, 0, 0]], "The lines and plane must not be parallel."),
+        (
+            Plane([0, 0, 0], [0, 0, 1]),
+            [[0, 0, 0], [0, 0, 0]],
+            [[0, 0, 1], [0, 1, 0]],
+            "The lines and plane must not be parallel.",
+        ),
+        (
+            Plane([0, 0, 0], [0, 0, 1]),
+            [[0, 0, 5]],
+            [[0, 0, 1], [1, 1, 1]],
+            "The points and directions must have the same shape.",
+        ),
+        (
+            Plane([0, 0, 0], [0, 0, 1]),
+            [[0, 0, 5], [1, 1, 1]],
+            [0, 0, 1],
+            "The points and directions must have the same shape.",
+        ),
+    ],
+)
+def test_intersect_lines_failure(plane, points, directions, message_expected):
+    with pytest.raises(ValueError, match=message_expected):
+        plane.intersect_lines(points, directions)
+
+
 @pytest.mark.parametrize(
     ("plane_a", "plane_b", "line_expected"),
     [
@@ -463,6 +699,21 @@ def test_best_fit_with_error(points, plane_expected, error_expected):
     assert math.isclose(error_fit, error_expected, abs_tol=1e-9)
 
 
+@pytest.mark.parametrize("aspect_ratio", [1e3, 1e6, 1e8])
+def test_best_fit_elongated(aspect_ratio):
+    rng = np.random.default_rng(0)
+    basis, _ = np.linalg.qr(rng.normal(size=(3, 3)))
+    vector_u, vector_v, normal_expected = basis.T
+
+    coords_u = aspect_ratio * rng.uniform(-1, 1, 100)
+    coords_v = rng.uniform(-1, 1, 100)
+    points = np.outer(coords_u, vector_u) + np.outer(coords_v, vector_v) + [1, 2, 3]
+
+    plane_fit = Plane.best_fit(points)
+
+    assert np.linalg.norm(np.cross(plane_fit.normal, normal_expected)) < 1e-9
+
+
 @pytest.mark.parametrize(
     ("points", "message_expected"),
     [
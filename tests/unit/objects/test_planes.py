@@ -0,0 +1,114 @@
+import numpy as np
+import pytest
+from skspatial.objects import Plane, Planes
+
+PLANES = [
+    Plane([0, 0, 0], [0, 0, 1]),
+    Plane([1, -2, 5], [0, 3, 0]),
+    Plane([-1, 4, 2], [1, 1, 1]),
+    Plane([2, 2, 2], [-5, 2, 0.5]),
+]
+
+
+@pytest.mark.parametrize(
+    ("points", "normals", "message_expected"),
+    [
+        ([[0, 0, 0]], [[0, 0]], "The points and normals must have the same shape."),
+        ([[0, 0, 0], [1, 1, 1]], [[0, 0, 1]], "The points and normals must have the same shape."),
+        ([[0, 0, 0]], [[0, 0, 0]], "The normals must not be zero vectors."),
+        ([[0, 0], [1, 1]], [[0, 1], [0, 0]], "The normals must not be zero vectors."),
+        ([[0, 0, np.nan]], [[0, 0, 1]], "The values must all be finite."),
+    ],
+)
+def test_failure(points, normals, message_expected):
+    with pytest.raises(ValueError, match=message_expected):
+        Planes(points, normals)
+
+
+def test_from_planes():
+    planes = Planes.from_planes(PLANES)
+
+    assert len(planes) == len(PLANES)
+    assert planes.dimension == 3
+
+    for plane, plane_expected in zip(planes, PLANES):
+        assert plane.point.is_close(plane_expected.point)
+        assert plane.normal.is_close(plane_expected.normal)
+
+
+@pytest.mark.parametrize(
+    "point",
+    [[0, 0, 0], [1, -2, 5], [3.5, 1, -7], [-10, 20, 30]],
+)
+def test_matches_plane(point):
+    planes = Planes.from_planes(PLANES)
+
+    assert np.allclose(planes.distance_point_signed(point), [plane.distance_point_signed(point) for plane in PLANES])
+    assert np.allclose(planes.distance_point(point), [plane.distance_point(point) for plane in PLANES])
+    assert np.array_equal(planes.side_point(point), [plane.side_point(point) for plane in PLANES])
+    assert np.allclose(planes.project_point(point), [plane.project_point(point) for plane in PLANES])
+
+    contains_expected = [plane.contains_point(point, abs_tol=1e-9) for plane in PLANES]
+    assert np.array_equal(planes.contains_point(point, abs_tol=1e-9), contains_expected)
+
+
+def test_plane_points_on_planes():
+    rng = np.random.default_rng(0)
+    points, normals = rng.uniform(-100, 100, size=(2, 1000, 3))
+    planes = Planes(points, normals)
+
+    for point in points[:5]:
+        distances_expected = [
+            Plane(point_plane, normal).distance_point_signed(point) for point_plane, normal in zip(points, normals)
+        ]
+        assert np.allclose(planes.distance_point_signed(point), distances_expected)
+
+    for i, point in enumerate(points):
+        assert planes.distance_point_signed(point)[i] == 0
+        assert planes.contains_point(point)[i]
+        assert planes.side_point(point)[i] == 0
+        assert np.array_equal(planes.project_point(point)[i], point)
+
+
+def test_read_only():
+    planes = Planes([[0, 0, 0]], [[0, 0, 1]])
+
+    with pytest.raises(ValueError, match="read-only"):
+        planes.points[0, 2] = 5
+
+    with pytest.raises(ValueError, match="read-only"):
+        planes.normals[0, 2] = 5
+
+    with pytest.raises(AttributeError):
+        planes.points = [[0, 0, 5]]
+
+    plane = planes[0]
+    plane.point[2] = 5
+
+    assert planes.points[0, 2] == 0
+
+
+def test_normals_array():
+    planes = Planes([[0, 0, 0]], [[0, 0, 1]])
+
+    assert type(planes.normals) is np.ndarray
+    assert "normals=array(" in repr(planes)
+
+
+@pytest.mark.parametrize("index", [slice(0, 1), 0.5, [0, 1]])
+def test_getitem_failure(index):
+    planes = Planes.from_planes(PLANES)
+
+    with pytest.raises(TypeError, match="The index must be an integer."):
+        planes[index]
+
+
+@pytest.mark.parametrize("point", [[np.nan, 0, 0], [0, np.inf, 0]])
+def test_non_finite_point(point):
+    planes = Planes.from_planes(PLANES)
+
+    with pytest.raises(ValueError, match="The values must all be finite."):
+        planes.side_point(point)
+
+    with pytest.raises(ValueError, match="The values must all be finite."):
+        planes.contains_point(point)
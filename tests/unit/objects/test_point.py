@@ -1,5 +1,6 @@
 from math import isclose, sqrt
 
+import numpy as np
 import pytest
 from skspatial.objects import Point
 
@@ -24,3 +25,25 @@ from skspatial.objects import Point
 def test_distance_point(array_a, array_b, dist_expected):
     point_a = Point(array_a)
     assert isclose(point_a.distance_point(array_b), dist_expected)
+
+
+@pytest.mark.parametrize(
+    "array_b",
+    [[1, 2, 3.5], (1, 2, 3.5), np.array([1, 2, 3.5]), Point([1, 2, 3.5])],
+)
+def test_distance_point_input_types(array_b):
+    assert Point([1, 2, 3]).distance_point(array_b) == 0.5
+
+
+@pytest.mark.parametrize(
+    ("array_b", "message_expected"),
+    [
+        ([1, 2, np.inf], "The values must all be finite."),
+        ([1, 2, np.nan], "The values must all be finite."),
+        ([[1], [2], [3]], "The array must be 1D."),
+        ([[1, 2, 3]], "The array must be 1D."),
+    ],
+)
+def test_distance_point_failure(array_b, message_expected):
+    with pytest.raises(ValueError, match=message_expected):
+        Point([1, 2, 3]).distance_point(array_b)
@@ -64,6 +64,20 @@ def test_dimension_of_slice():
     assert points[0, :].dimension is None
 
 
+@pytest.mark.parametrize(
+    "array_points",
+    [
+        [[0, 1]],
+        [[1, 1], [1, 1]],
+        [[2, 0], [1, 5], [2, 0], [1, -5]],
+        [[0.5, -1, 2], [0.5, -1, 2], [-3, 4, 1], [0.5, -1, 1.5]],
+        [[1, 2, 3, 4], [1, 2, 3, 4], [4, 3, 2, 1], [0, 0, 0, 0]],
+    ],
+)
+def test_unique(array_points):
+    assert_array_equal(Points(array_points).unique(), np.unique(array_points, axis=0))
+
+
 @pytest.mark.parametrize(
     ("array_points", "array_centered_expected", "centroid_expected"),
     [
@@ -123,3 +137,121 @@ def test_are_collinear(points, bool_expected):
     """Test checking if multiple points are collinear."""
 
     assert Points(points).are_collinear() is bool_expected
+
+
+@pytest.mark.parametrize(
+    ("points", "kwargs", "rank_expected"),
+    [
+        ([[5, 5]], {}, 0),
+        ([[5, 5], [5, 5], [5, 5]], {}, 0),
+        ([[5, 5], [5, 5]], {"tol": 1}, 0),
+        ([[0, 0], [1e-3, 0]], {}, 1),
+        ([[0, 0], [1e-3, 0], [1e-3, 0]], {}, 1),
+        ([[0, 0], [1e-3, 0]], {"tol": 1}, 0),
+        ([[0, 0, 0], [1, 2, 3], [0, 0, 0]], {}, 1),
+        ([[0, 0, 0], [1, 2, 3], [1, 0, 0]], {}, 2),
+        ([[0, 0, 0], [1, 2, 3], [1, 0, 0]], {"tol": 10}, 0),
+        ([[0, 0, 0, 0, 0], [1, 2, 3, 4, 5], [2, 4, 6, 8, 10]], {}, 1),
+        ([[0, 0, 0, 0, 0], [1, 2, 3, 4, 5], [5, 4, 3, 2, 1]], {}, 2),
+        ([[0, 0, 0, 0, 0], [1, 2, 3, 4, 5], [5, 4, 3, 2, 1]], {"tol": 10}, 0),
+    ],
+)
+def test_affine_rank(points, kwargs, rank_expected):
+    assert Points(points).affine_rank(**kwargs) == rank_expected
+
+
+@pytest.mark.parametrize(
+    ("points", "point"),
+    [
+        ([[0, 0], [3, 4], [-1, 1]], [0, 0]),
+        ([[0, 0, 0], [1, 2, 2], [3, 0, 4]], [1, 2, 2]),
+        ([[0.5, -2, 7.25], [1e3, 1e-3, 0]], [-4, 1, 2.5]),
+        ([[1, 2, 3, 4]], [4, 3, 2, 1]),
+    ],
+)
+def test_distance_point(points, point):
+    distances_expected = [Point(row).distance_point(point) for row in points]
+
+    assert_array_almost_equal(Points(points).distance_point(point), distances_expected)
+
+
+@pytest.mark.parametrize(
+    "points",
+    [
+        [[0, 0]],
+        [[0, 0], [3, 4], [-1, 1]],
+        [[0, 0, 0], [1, 2, 2], [3, 0, 4], [1, 2, 2]],
+        [[1e3, 1e3, 1e3], [1e3 + 1, 1e3, 1e3], [1e3, 1e3 - 2, 1e3]],
+        [[1, 2, 3, 4], [4, 3, 2, 1]],
+    ],
+)
+def test_pairwise_distance(points):
+    points = Points(points)
+
+    distances = points.pairwise_distance()
+    distances_expected = [points.distance_point(point) for point in points]
+
+    assert_array_almost_equal(distances, distances_expected)
+    assert_array_equal(distances, distances.T)
+    assert_array_equal(np.diag(distances), 0)
+
+
+@pytest.mark.parametrize(
+    ("dtype", "dtype_expected"),
+    [
+        (np.int64, np.float64),
+        (np.float32, np.float32),
+        (np.float64, np.float64),
+    ],
+)
+def test_distance_dtype(dtype, dtype_expected):
+    points = Points(np.array([[0, 0, 0], [1, 2, 2], [3, 0, 4]], dtype=dtype))
+
+    assert points.distance_point([0.5, 0, 0]).dtype == dtype_expected
+    assert points.pairwise_distance().dtype == dtype_expected
+    assert_array_almost_equal(points.distance_point([0, 0, 0]), [0, 3, 5], decimal=6)
+
+
+@pytest.mark.parametrize(
+    "points",
+    [
+        [[1, 1]],
+        [[1, 1], [1, 1], [1, 1]],
+        [[1, 1], [1, 1], [1, 1.5]],
+        [[0, 0, 0], [1e-12, 0, 0]],
+        [[0, 0, 0], [1, 2, 3]],
+        [[0, 0, 0], [1, 2, 3], [5, 2, 0]],
+        [[0, 0, 0], [1, 2, 3], [2, 4, 6], [3, 6, 9]],
+        [[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1]],
+    ],
+)
+@pytest.mark.parametrize("kwargs", [{}, {"tol": 1e-6}])
+def test_are_concurrent_collinear_coplanar(points, kwargs):
+    points = Points(points)
+    rank = points.affine_rank(**kwargs)
+
+    assert points.are_concurrent(**kwargs) is bool(rank == 0)
+    assert points.are_collinear(**kwargs) is bool(rank <= 1)
+    assert points.are_coplanar(**kwargs) is bool(rank <= 2)
+
+
+@pytest.mark.parametrize("order", ["C", "F"])
+@pytest.mark.parametrize("dimension", [1, 2, 3, 5])
+@pytest.mark.parametrize("n_points", [1, 20, 1000])
+def test_distance_point_layout(order, dimension, n_points):
+    array = np.random.default_rng(0).normal(size=(n_points, dimension))
+    point = np.arange(dimension)
+
+    points = Points(np.asarray(array, order=order))
+    distances_expected = np.linalg.norm(array - point, axis=1)
+
+    assert_array_almost_equal(points.distance_point(point), distances_expected)
+
+
+@pytest.mark.parametrize("n_points", [2, 1000])
+@pytest.mark.parametrize("point", [[0, 0], [0, 0, 0, 0], [[1, 1, 1]], [[1, 1, 1], [2, 2, 2]], 1])
+def test_distance_point_failure(n_points, point):
+    message_expected = "The point must have the same dimension as the points."
+
+    with pytest.raises(ValueError, match=message_expected):
+        Points(np.zeros((n_points, 3))).distance_point(point)
@@ -183,6 +183,47 @@ def test_intersect_line_failure(sphere, line):
         sphere.intersect_line(line)
 
 
+def test_intersect_lines():
+    sphere = Sphere([1, -2, 0.5], 2)
+    lines = [
+        Line([0, 0, 0], [1, 0, 0]),
+        Line([1, -2, 0.5], [1, 1, 1]),
+        Line([3, -2, 0.5], [0, 0, 5]),
+        Line([10, 10, 10], [1, 0, 0]),
+        Line([-4, 3, 1], [-1, 2, 0.5]),
+    ]
+
+    points_a, points_b, is_intersecting = sphere.intersect_lines(
+        [line.point for line in lines],
+        [line.direction for line in lines],
+    )
+
+    for line, point_a, point_b, intersecting in zip(lines, points_a, points_b, is_intersecting):
+        try:
+            point_a_expected, point_b_expected = sphere.intersect_line(line)
+        except ValueError:
+            assert not intersecting
+            assert np.isnan(point_a).all()
+            assert np.isnan(point_b).all()
+        else:
+            assert intersecting
+            assert point_a_expected.is_close(point_a, abs_tol=1e-12)
+            assert point_b_expected.is_close(point_b, abs_tol=1e-12)
+
+
+@pytest.mark.parametrize(
+    ("points", "directions", "message_expected"),
+    [
+        ([[0, 0, 0]], [[1, 0, 0], [0, 1, 0]], "The points and directions must have the same shape."),
+        ([[0, 0, 0], [1, 1, 1]], [[1, 0, 0], [0, 0, 0]], "The directions must not be zero vectors."),
+        ([[0, 0, np.inf]], [[1, 0, 0]], "The values must all be finite."),
+    ],
+)
+def test_intersect_lines_failure(points, directions, message_expected):
+    with pytest.raises(ValueError, match=message_expected):
+        Sphere([0, 0, 0], 1).intersect_lines(points, directions)
+
+
 @pytest.mark.parametrize(
     ("sphere", "n_angles", "points_expected"),
     [
@@ -199,3 +240,22 @@ def test_to_points(sphere, n_angles, points_expected):
     points_unique = Points(array_rounded).unique()
 
     assert points_unique.is_close(points_expected)
+
+
+@pytest.mark.parametrize(
+    ("point", "radius", "n_angles"),
+    [
+        ([0, 0, 0], 1, 5),
+        ([1, -2, 3], 2.5, 30),
+        ([0.5, 0.5, 0.5], 10, 2),
+    ],
+)
+def test_to_mesh(point, radius, n_angles):
+    sphere = Sphere(point, radius)
+
+    X, Y, Z = sphere.to_mesh(n_angles)
+
+    assert X.shape == Y.shape == Z.shape == (n_angles, n_angles)
+
+    points_mesh = np.stack([X.ravel(), Y.ravel(), Z.ravel()], axis=1)
+    assert np.allclose(Points(points_mesh).distance_point(point), radius)
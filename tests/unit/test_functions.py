@@ -1,7 +1,8 @@
 from math import isclose, sqrt
 
+import numpy as np
 import pytest
-from skspatial._functions import _solve_quadratic
+from skspatial._functions import _allclose, _cross_3d, _solve_quadratic
 
 A_MUST_BE_NON_ZERO = "The coefficient `a` must be non-zero."
 DISCRIMINANT_MUST_NOT_BE_NEGATIVE = "The discriminant must not be negative."
@@ -37,3 +38,32 @@ def test_solve_quadratic(a, b, c, x1_expected, x2_expected):
 def test_solve_quadratic_failure(a, b, c, message_expected):
     with pytest.raises(ValueError, match=message_expected):
         _solve_quadratic(a, b, c)
+
+
+@pytest.mark.parametrize(
+    ("array_a", "array_b"),
+    [
+        ([1, 0, 0], [0, 1, 0]),
+        ([1, 1, 1], [0, 1, 0]),
+        ([2, -3, 5], [7, 1, -4]),
+        ([0.5, 2.5, -1.5], [1, 1, 1]),
+        ([1, 2, 3], [2, 4, 6]),
+    ],
+)
+def test_cross_3d(array_a, array_b):
+    assert np.array_equal(_cross_3d(array_a, array_b), np.cross(array_a, array_b))
+
+
+VALUES_ISCLOSE = [0, -0.0, 1, 1 + 1e-10, 1 + 1e-8, -1, 1e-300, 5e-324, 1e308, -1e308, np.inf, -np.inf, np.nan]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{}, {"abs_tol": 1e-9}, {"rel_tol": 0.5}, {"rel_tol": 0, "abs_tol": 0}, {"abs_tol": np.inf}],
+)
+def test_allclose(kwargs):
+    array_a, array_b = np.meshgrid(VALUES_ISCLOSE, VALUES_ISCLOSE)
+
+    bools_expected = [isclose(a, b, **kwargs) for a, b in zip(array_a.ravel(), array_b.ravel())]
+
+    assert np.array_equal(_allclose(array_a, array_b, **kwargs).ravel(), bools_expected)